@@ -4,6 +4,7 @@ For more information, please visit https://docs.sentimentinvestor.com/python/
 """
 
 from . import sentipy
+from .sentipy import Sentipy
 
-__all__ = ["sentipy", "ws"]
+__all__ = ["Sentipy", "sentipy", "ws"]
 __version__ = "1.1.0"
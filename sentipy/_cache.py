@@ -0,0 +1,138 @@
+"""Provides the time-limited response cache used by the Sentipy client.
+
+Entries are kept in memory, and can additionally be persisted as JSON files so that they survive between processes.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Optional
+
+from sentipy._compat import json_loads
+from sentipy._typing_imports import DictType, JSONType, TupleType
+
+# cached files live in a subdirectory of their own, named after the md5 of their key
+_SUBDIRECTORY = "sentipy-responses"
+_FILENAME = re.compile(r"[0-9a-f]{32}\.json")
+
+
+class TTLCache:
+    """A mapping of API responses that each expire a given number of seconds after being stored.
+
+    It is safe to use from several threads at once, such as the workers that `Sentipy.bulk` starts.
+    """
+
+    def __init__(self, directory: Optional[str] = None, maxsize: int = 4096) -> None:
+        """Initialise an empty cache.
+
+        Args:
+            directory: if given, responses are also stored as JSON files in a ``sentipy-responses`` subdirectory
+                of this directory
+            maxsize: how many responses to keep in memory at most, evicting the oldest first
+        """
+        # maps each key to (monotonic expiry time, response), oldest first
+        self._entries: DictType[TupleType[Any, ...], TupleType[float, JSONType]] = {}
+        self._maxsize = maxsize
+        # guards _entries, which eviction iterates over while other threads may be adding to it
+        self._lock = threading.Lock()
+        self._directory = (
+            os.path.join(os.path.expanduser(directory), _SUBDIRECTORY)
+            if directory is not None
+            else None
+        )
+
+    @staticmethod
+    def _path(directory: str, key: TupleType[Any, ...]) -> str:
+        # files are grouped by endpoint, which is always the first element of the key
+        digest = hashlib.md5(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(directory, str(key[0]), f"{digest}.json")
+
+    def get(self, key: TupleType[Any, ...]) -> Optional[JSONType]:
+        """Look up a response that has not expired yet.
+
+        Args:
+            key: the key the response was stored under
+
+        Returns: the response, or None if there is no fresh entry for `key`
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > time.monotonic():
+                    return value
+                del self._entries[key]
+
+        if self._directory is None:
+            return None
+        try:
+            with open(self._path(self._directory, key), "rb") as file:
+                # the expiry time is stored as the file's modification time
+                remaining = os.fstat(file.fileno()).st_mtime - time.time()
+                if remaining <= 0:
+                    return None
+                value = json_loads(file.read())
+        except (OSError, ValueError):
+            return None
+        self._store(key, time.monotonic() + remaining, value)
+        return value
+
+    def _store(self, key: TupleType[Any, ...], expires: float, value: JSONType) -> None:
+        with self._lock:
+            # re-inserting moves the key to the end, so the first entries are always the oldest
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._maxsize:
+                now = time.monotonic()
+                for stale in [k for k, (e, _) in self._entries.items() if e <= now]:
+                    del self._entries[stale]
+                if len(self._entries) >= self._maxsize:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (expires, value)
+
+    def set(self, key: TupleType[Any, ...], value: JSONType, ttl: float) -> None:
+        """Store a response for `ttl` seconds.
+
+        Args:
+            key: the key to store the response under
+            value: the response to store
+            ttl: how many seconds the response stays fresh for
+        """
+        self._store(key, time.monotonic() + ttl, value)
+
+        if self._directory is None:
+            return
+        path = self._path(self._directory, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                json.dump(value, file)
+            expires = time.time() + ttl
+            os.utime(path, (expires, expires))
+        except OSError:
+            # the on-disk copy is only an optimisation
+            pass
+
+    def clear(self) -> None:
+        """Forget all cached responses, in memory and on disk.
+
+        Only files laid out the way :meth:`set` writes them are removed, so anything else in the directory is kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+        if self._directory is None:
+            return
+        try:
+            endpoints = os.listdir(self._directory)
+        except OSError:
+            return
+        for endpoint in endpoints:
+            folder = os.path.join(self._directory, endpoint)
+            if not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                if _FILENAME.fullmatch(name):
+                    os.remove(os.path.join(folder, name))
@@ -0,0 +1,48 @@
+"""Provides shims around runtime dependencies that can be configured or swapped out.
+
+Runtime type checking with beartype is disabled when Python runs with optimisations enabled
+(``python -O`` or ``PYTHONOPTIMIZE``) or when the ``SENTIPY_NO_TYPECHECK`` environment variable is set.
+In that case beartype is not even imported.
+
+JSON is decoded with orjson when it is installed (``pip install sentiment-investor[fast]``),
+falling back to the standard library otherwise.
+Large list responses are parsed incrementally when ijson's C backend is also installed,
+and brotli-compressed responses are accepted when brotli is.
+"""
+
+import os
+from typing import Any, Callable, Iterator, Optional, TypeVar, Union
+
+TYPECHECK_DISABLED = bool(os.environ.get("SENTIPY_NO_TYPECHECK")) or not __debug__
+"""Whether the public API skips beartype's runtime type checks."""
+
+_CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
+
+if TYPECHECK_DISABLED:
+
+    def beartype(func: _CallableT) -> _CallableT:
+        """Return the decorated callable unchanged, skipping runtime type checks."""
+        return func
+
+else:
+    from beartype import beartype
+
+json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    json_loads = json.loads
+
+ijson_items: Optional[Callable[..., Iterator[Any]]]
+try:
+    # only the C backend is faster than parsing the whole response with orjson
+    # ijson comes with no type hints
+    import ijson.backends.yajl2_c  # type: ignore[import]
+
+    ijson_items = ijson.backends.yajl2_c.items
+except ImportError:
+    ijson_items = None
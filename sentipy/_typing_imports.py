@@ -10,29 +10,42 @@ PYTHON_AT_LEAST_3_9 = sys.version_info >= (3, 9)
 
 # Initialised first with Any to make mypy happy
 # See https://mypy.readthedocs.io/en/stable/common_issues.html#variables-vs-type-aliases
+AsyncIteratorType: Any = None
 DictType: Any = None
 IterableType: Any = None
+IteratorType: Any = None
 ListType: Any = None
 SetType: Any = None
 TupleType: Any = None
 
 if PYTHON_AT_LEAST_3_9:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterator, Iterable, Iterator
 
+    AsyncIteratorType = AsyncIterator
     DictType = dict
     IterableType = Iterable
+    IteratorType = Iterator
     ListType = list
     SetType = set
     TupleType = tuple
 else:
-    from typing import Dict, Iterable, List, Set, Tuple
+    from typing import AsyncIterator, Dict, Iterable, Iterator, List, Set, Tuple
 
+    AsyncIteratorType = AsyncIterator
     DictType = Dict
     IterableType = Iterable
+    IteratorType = Iterator
     ListType = List
     SetType = Set
     TupleType = Tuple
 
+# pandas is an optional dependency, so data frames can't be named in annotations checked at runtime
+# object rather than Any, which older beartype versions reject as a bare hint on newer Pythons
+DataFrameType = object
+
+# Likewise for NumPy arrays
+NDArrayType = object
+
 # See https://github.com/python/typing/issues/182
 # Maybe convert to TypedDict at some point?
 JSONType = DictType[str, Any]
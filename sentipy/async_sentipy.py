@@ -0,0 +1,278 @@
+"""An asyncio version of the Sentiment Investor Python Client library.
+
+This provides the AsyncSentipy object, which issues requests concurrently rather than one after the other.
+It requires aiohttp, which can be installed with ``pip install sentiment-investor[async]``.
+
+For more information, please visit https://docs.sentimentinvestor.com/python/
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Optional, Union
+
+# aiohttp is an optional dependency
+import aiohttp
+
+from sentipy._compat import beartype, json_loads
+from sentipy._typing_imports import (
+    AsyncIteratorType,
+    DictType,
+    IterableType,
+    JSONType,
+    ListType,
+)
+from sentipy.sentipy import (
+    _ENDPOINTS,
+    Sentipy,
+    _ApiResponse,
+    _ApiResult,
+    _check_metric,
+    _QuoteRecord,
+    _timestamp_and_data,
+)
+from sentipy.ws import StockUpdateData, _Stream
+
+_logger = logging.getLogger(__name__)
+
+# beartype checks the coroutine object returned by an async function rather than its result,
+# so only the synchronous methods below are decorated
+
+
+class AsyncSentipy:
+    """This defines an asyncio SentiPy object, through which many requests can be awaited concurrently.
+
+    Examples:
+        >>> async def main():
+        ...     async with AsyncSentipy(token=token, key=key) as sentipy:
+        ...         quotes = await sentipy.quote_many(["AAPL", "TSLA", "PYPL"])
+        ...
+        >>> asyncio.run(main())
+
+    .. versionadded:: 2.2.0
+    """
+
+    base_url = Sentipy.base_url
+    """
+    The base URL of the SentimentInvestor API
+    """
+
+    max_connections = 32
+    """
+    The maximum number of connections to keep open to the API at once
+    """
+
+    timeout = 30.0
+    """
+    The total timeout for each request to the API, in seconds
+    """
+
+    @beartype
+    def __init__(self, token: str, key: str) -> None:
+        """Initialise a new AsyncSentipy instance with your token and key.
+
+        Args:
+            token: API token from the SentimentInvestor website
+            key: API key from the SentimentInvestor website
+        """
+        self._credentials = {"token": token, "key": key}
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _ENDPOINTS}
+        # created on first use, since aiohttp sessions must be created inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @beartype
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Accept": "application/json"},
+            )
+        return self._session
+
+    async def _base_request(
+        self, endpoint: str, params: Optional[JSONType] = None
+    ) -> JSONType:
+        """Make a request to a specific REST endpoint on the SentimentInvestor API.
+
+        Args:
+            endpoint: the REST endpoint (final fragment in URL)
+            params: any supplementary parameters to pass to the API
+
+        Returns: the JSON response if the request was successful, otherwise an exception is raised.
+        """
+        query: DictType[str, Any] = dict(self._credentials)
+        if params is not None:
+            # aiohttp only accepts strings and numbers as query values
+            query.update(
+                (k, str(v) if isinstance(v, bool) else v) for k, v in params.items()
+            )
+        async with self._get_session().get(self._urls[endpoint], params=query) as r:
+            return Sentipy._parse_response(await r.read(), r.status)
+
+    async def parsed(self, symbol: str) -> _ApiResult:
+        """The parsed data endpoints provides the four core metrics for a stock: AHI, RHI, SGP and sentiment.
+
+        Args:
+            symbol: string specifying the ticker or symbol of the stock to request data for
+
+        Returns: a QuoteData object
+        """
+        return _ApiResult._from_trusted(
+            await self._base_request("parsed", {"symbol": symbol})
+        )
+
+    async def raw(self, symbol: str) -> _ApiResult:
+        """The raw data endpoint provides access to raw data metrics for the monitored social platforms.
+
+        Args:
+            symbol: ticker or symbol of the stock to request data for
+
+        Returns: a QuoteData object
+        """
+        return _ApiResult._from_trusted(
+            await self._base_request("raw", {"symbol": symbol})
+        )
+
+    async def quote(self, symbol: str, enrich: bool = False) -> _QuoteRecord:
+        """The quote data endpoint provides access to all realtime data about stocks along with further data if requested.
+
+        Args:
+            symbol: ticker or symbol of the stock to request data for
+            enrich: whether to request enriched data
+
+        Returns: a QuoteData object
+        """
+        params = {"symbol": symbol, "enrich": enrich}
+        return _QuoteRecord(await self._base_request("quote", params))
+
+    async def quote_many(
+        self, symbols: IterableType[str], enrich: bool = False
+    ) -> DictType[str, _QuoteRecord]:
+        """Get quote data for several stocks in a single request, see `bulk`.
+
+        Args:
+            symbols: tickers or symbols of the stocks to request data for
+            enrich: whether to request enriched data
+
+        Returns: a dictionary of (symbol -> QuoteData object) mappings
+        """
+        return {quote.symbol: quote for quote in await self.bulk(list(symbols), enrich)}
+
+    async def sort(self, metric: str, limit: int) -> ListType[_ApiResponse]:
+        """The sort data endpoint provides access to ordered rankings of stocks across core metrics.
+
+        Args:
+            metric: the metric by which to sort the stocks
+            limit: the maximum number of stocks to return
+
+        Returns: a list of TickerData objects
+
+        Raises:
+            ValueError: if `metric` is not provided by the API
+        """
+        _check_metric(metric)
+        data = await self._base_request("sort", {"metric": metric, "limit": limit})
+        return [_ApiResponse._from_trusted(dp) for dp in data["results"]]
+
+    async def historical(
+        self, symbol: str, metric: str, start: int, end: int
+    ) -> DictType[Union[int, float], Union[int, float]]:
+        """The historical data endpoint provides access to historical data for stocks.
+
+        Args:
+            symbol: the stock to look up historical data for
+            metric: the metric for which to return data
+            start: Unix epoch timestamp in seconds specifying start of date range
+            end: Unix epoch timestamp in seconds specifying end of date range
+
+        Returns (dict): a dictionary of (timestamp -> data entry) mappings.
+
+        Raises:
+            ValueError: if `metric` is not provided by the API
+        """
+        _check_metric(metric)
+        params = {"symbol": symbol, "metric": metric, "start": start, "end": end}
+        data = await self._base_request("historical", params)
+        return dict(map(_timestamp_and_data, data["results"]))
+
+    async def bulk(
+        self, symbols: ListType[str], enrich: bool = False
+    ) -> ListType[_QuoteRecord]:
+        """Get quote data for several stocks simultaneously.
+
+        Args:
+            symbols: list of stocks to get quote data for
+            enrich: whether to get enriched data
+
+        Returns: a list of TickerData objects
+        """
+        params = {"symbols": ",".join(symbols), "enrich": enrich}
+        data = await self._base_request("bulk", params)
+        return [_QuoteRecord(result) for result in data["results"]]
+
+    async def stream(
+        self, symbols: Optional[IterableType[str]] = None
+    ) -> AsyncIteratorType[StockUpdateData]:
+        """Receive live stock updates from the websocket API.
+
+        Updates for all stocks are received unless `symbols` is given.
+        The connection is re-established whenever it drops, without growing the stack or blocking a thread.
+
+        Args:
+            symbols: tickers or symbols of the stocks to receive updates for
+
+        Returns: an asynchronous iterator of StockUpdateData objects, which never ends by itself
+
+        Raises:
+            ValueError: if the server rejects the token and key
+
+        Examples:
+            >>> async for update in sentipy.stream(["AAPL", "TSLA"]):
+            ...     print(update.symbol, update.AHI)
+        """
+        params: DictType[str, Any] = dict(self._credentials)
+        if symbols is None:
+            url = _Stream.base_url + "all"
+        else:
+            url = _Stream.base_url + "stocks"
+            params["symbols"] = list(symbols)
+        auth_payload = json.dumps(params)
+
+        delay = _Stream.reconnect_delay
+        while True:
+            try:
+                async with self._get_session().ws_connect(url, heartbeat=30) as ws:
+                    await ws.send_str(auth_payload)
+                    async for message in ws:
+                        if message.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        data = json_loads(message.data)
+                        if "authState" not in data:
+                            yield StockUpdateData.from_dict(data)
+                        elif not data["authState"]:
+                            raise ValueError("Not authenticated or invalid request")
+                        else:
+                            delay = _Stream.reconnect_delay
+                _logger.warning("WebSocket closed, reconnecting")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                _logger.warning("WebSocket error %s, reconnecting", error)
+            # back off exponentially rather than hammering a server that is down
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _Stream.max_reconnect_delay)
+
+    async def close(self) -> None:
+        """Close any connections to the API kept open by this instance."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncSentipy":
+        """Use this instance as an async context manager that closes its connections on exit."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close this instance's connections, see `close`."""
+        await self.close()
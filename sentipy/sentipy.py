@@ -6,17 +6,92 @@ For more information, please visit https://docs.sentimentinvestor.com/python/
 """
 
 import enum
-import json
-from typing import Optional, Union
+import hashlib
+import itertools
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Callable, Optional, Union
 
 import requests
-from beartype import beartype
-
-from sentipy._typing_imports import DictType, JSONType, ListType, SetType, TupleType
-
-
-class AccountTier(enum.Enum):
-    """Defines which tier the user's Sentiment Investor account is."""
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from sentipy._cache import TTLCache
+from sentipy._compat import beartype, ijson_items, json_loads
+from sentipy._typing_imports import (
+    DataFrameType,
+    DictType,
+    IterableType,
+    IteratorType,
+    JSONType,
+    ListType,
+    NDArrayType,
+    SetType,
+    TupleType,
+)
+
+# every REST endpoint the client calls
+_ENDPOINTS = frozenset(
+    {
+        "parsed",
+        "raw",
+        "quote",
+        "sort",
+        "historical",
+        "bulk",
+        "all",
+        "supported",
+        "all-stocks",
+        "account",
+    }
+)
+
+# the metrics provided by the API, which sort and historical accept
+_METRICS = frozenset(
+    {
+        "AHI",
+        "RHI",
+        "SGP",
+        "sentiment",
+        "reddit_comment_mentions",
+        "reddit_comment_sentiment",
+        "reddit_comment_relative_hype",
+        "reddit_post_mentions",
+        "reddit_post_sentiment",
+        "reddit_post_relative_hype",
+        "tweet_mentions",
+        "tweet_sentiment",
+        "tweet_relative_hype",
+        "stocktwits_post_mentions",
+        "stocktwits_post_sentiment",
+        "stocktwits_post_relative_hype",
+        "yahoo_finance_comment_mentions",
+        "yahoo_finance_comment_sentiment",
+        "yahoo_finance_comment_relative_hype",
+    }
+)
+
+# extracts a (timestamp, data) pair from each historical data point in C
+_timestamp_and_data = itemgetter("timestamp", "data")
+
+# HTTP statuses and legacy bodies (sent instead of JSON) indicating that the token or key was rejected
+_AUTH_ERROR_STATUSES = (401, 403)
+_AUTH_ERRORS = (b"invalid_parameter", b"incorrect_key")
+
+
+class AccountTier(float, enum.Enum):
+    """Defines which tier the user's Sentiment Investor account is.
+
+    Tiers are floats, so they can be ordered and compared with plain numbers directly.
+
+    Examples:
+        >>> AccountTier.PREMIUM > AccountTier.STARTER
+        True
+        >>> AccountTier.ENTERPRISE == 2
+        True
+    """
 
     SANDBOX = 0
     STARTER = 1
@@ -30,14 +105,28 @@ class _ApiResponse:
     .. attention:: Do not try to initialise one yourself.
     """
 
-    @beartype
     def __init__(self, json: JSONType) -> None:
-        # for every metric returned in the json set it as an attribute for this object
-        for k, v in json.items():
-            # do not create a results parameter if present as this is handled by derived classes separately
-            if k == "results":
-                continue
-            setattr(self, k, v)
+        # set every metric returned in the json as an attribute for this object in one go
+        attributes = dict(json)
+        # do not create a results parameter if present as this is handled by derived classes separately
+        attributes.pop("results", None)
+        self.__dict__.update(attributes)
+
+    @classmethod
+    def _from_trusted(cls, json: JSONType) -> "_ApiResponse":
+        """Wrap a freshly parsed JSON object without copying it or calling `__init__`.
+
+        The dictionary becomes the new object's ``__dict__``, so it must not be shared with anything else.
+
+        Args:
+            json: a JSON object fresh from the parser
+
+        Returns: the new object, backed by `json`
+        """
+        obj: _ApiResponse = object.__new__(cls)
+        json.pop("results", None)
+        obj.__dict__ = json
+        return obj
 
     def __repr__(self) -> str:
         return str(self.__dict__)
@@ -46,15 +135,124 @@ class _ApiResponse:
 class _ApiResult(_ApiResponse):
     """For a list of available metrics, use `dir(object)`.
 
-    .. attention:: Returned by quote, do not try to initialise one yourself.
+    .. attention:: Returned by parsed and raw, do not try to initialise one yourself.
     """
 
-    @beartype
     def __init__(self, json: JSONType) -> None:
-        super().__init__(json)
-        for k, v in json.get("results").items():
+        # flatten the nested results into the top-level fields, then set them all at once
+        attributes = dict(json)
+        attributes.update(attributes.pop("results"))
+        self.__dict__.update(attributes)
+
+    @classmethod
+    def _from_trusted(cls, json: JSONType) -> "_ApiResult":
+        """Wrap a freshly parsed JSON object without copying it or calling `__init__`.
+
+        The nested results are flattened into the dictionary in place,
+        which then becomes the new object's ``__dict__``, so it must not be shared with anything else.
+
+        Args:
+            json: a JSON object fresh from the parser
+
+        Returns: the new object, backed by `json`
+        """
+        obj: _ApiResult = object.__new__(cls)
+        json.update(json.pop("results"))
+        obj.__dict__ = json
+        return obj
+
+
+class _QuoteRecord(_ApiResult):
+    """For a list of available metrics, use `dir(object)`.
+
+    The metrics every quote carries are stored in slots rather than a per-instance dictionary,
+    which roughly halves the memory used by each record.
+    Any other fields, such as enriched data, are stored as regular attributes.
+
+    .. versionchanged:: 2.2.0
+        ``vars(object)`` only holds the fields that are not slots, use `dir(object)` to list every field.
+
+    .. attention:: Returned by quote, bulk and all, do not try to initialise one yourself.
+    """
+
+    __slots__ = ("success", "symbol", *sorted(_METRICS))
+
+    def __init__(self, json: JSONType) -> None:
+        fields = dict(json)
+        fields.update(fields.pop("results", None) or {})
+        # slot descriptors take the known metrics, anything else ends up in __dict__
+        for k, v in fields.items():
             setattr(self, k, v)
 
+    def __dir__(self) -> IterableType[str]:
+        # every slot is a class attribute, so leave out the ones this record has no value for
+        unset = {k for k in self.__slots__ if not hasattr(self, k)}
+        return [name for name in super().__dir__() if name not in unset]
+
+    def __repr__(self) -> str:
+        fields = {k: getattr(self, k) for k in self.__slots__ if hasattr(self, k)}
+        fields.update(self.__dict__)
+        return str(fields)
+
+
+class _ChunkReader:
+    """Presents an iterator of byte chunks as a minimal readable file for ijson."""
+
+    def __init__(self, chunks: IteratorType[bytes]) -> None:
+        self._chunks = chunks
+        # the chunks read so far, until the caller sets this to None because it no longer needs them
+        self.consumed: Optional[ListType[bytes]] = []
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes the file type with read(0), then accepts chunks of any length until an empty one
+        if size == 0:
+            return b""
+        chunk = next(self._chunks, b"")
+        if self.consumed is not None:
+            self.consumed.append(chunk)
+        return chunk
+
+
+@beartype
+def _check_metric(metric: str) -> None:
+    """Reject unknown metric names before spending a round trip on them.
+
+    Args:
+        metric: the metric name to check
+
+    Raises:
+        ValueError: if `metric` is not provided by the API
+    """
+    if metric not in _METRICS:
+        raise ValueError(
+            f"Unknown metric {metric!r}, expected one of {', '.join(sorted(_METRICS))}"
+        )
+
+
+@beartype
+def _to_frame(results: IterableType[JSONType]) -> DataFrameType:
+    """Collect API results into a columnar pandas DataFrame with one row per result.
+
+    Args:
+        results: the JSON entries to collect, such as the ``results`` of a list endpoint
+
+    Returns: a DataFrame with one column per metric, with float metrics stored in single precision
+
+    Raises:
+        ImportError: if pandas is not installed
+    """
+    try:
+        # pandas comes with no type hints
+        import pandas  # type: ignore[import]
+    except ImportError:
+        raise ImportError(
+            "as_frame=True requires pandas, install it with `pip install sentiment-investor[pandas]`"
+        ) from None
+    frame = pandas.DataFrame.from_records(list(results))
+    for column in frame.select_dtypes("float64").columns:
+        frame[column] = pandas.to_numeric(frame[column], downcast="float")
+    return frame
+
 
 class Sentipy:
     """This defines the main SentiPy object through which the user authenticates themselves."""
@@ -64,6 +262,37 @@ class Sentipy:
     The base URL of the SentimentInvestor API
     """
 
+    pool_maxsize = 20
+    """
+    The maximum number of connections to keep open to the API, for use by concurrent requests
+    """
+
+    cache_ttl = 24 * 60 * 60.0
+    """
+    How many seconds to reuse responses from slowly changing endpoints (`supported` and `all_stocks`) for
+    """
+
+    historical_cache_ttl = 30 * 24 * 60 * 60.0
+    """
+    How many seconds to reuse historical data for, once its date range is more than an hour in the past
+    """
+
+    cache_dir: Optional[str] = None
+    """
+    A directory such as ``~/.cache`` to also persist cached responses in, so they survive restarts.
+    They are written to a ``sentipy-responses`` subdirectory, which :meth:`clear_cache` empties
+    """
+
+    timeout = (3.05, 30.0)
+    """
+    The connect and read timeouts for requests to the API, in seconds
+    """
+
+    max_retries = 3
+    """
+    How many times to retry requests that fail with a transient gateway error (502, 503 or 504)
+    """
+
     @beartype
     def __init__(self, token: str, key: str) -> None:
         """Initialise a new SentiPy instance with your token and key.
@@ -80,44 +309,215 @@ class Sentipy:
         Raises:
             `ValueError` if either `token` or `key` not provided
         """
-        self.token = token
-        self.key = key
+        # built once and shared with the session, so credentials are never merged into params per call
+        self._credentials = {"token": token, "key": key}
+
+        # reuse connections across requests rather than doing a fresh TCP + TLS handshake for every call
+        self._session = requests.Session()
+        # authenticate every request made through the session
+        self._session.params = self._credentials
+        self._session.headers["Accept"] = "application/json"
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            # hand the last response back so that _parse_response reports the server's error
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_maxsize=self.pool_maxsize, max_retries=retry)
+        )
+        # ask for compressed responses, including brotli whenever a decoder for it is installed
+        self._session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+            "accept-encoding"
+        ]
+
+        # resolved once here rather than on each request; also rejects unknown endpoints
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in _ENDPOINTS}
+
+        self._cache = TTLCache(self.cache_dir)
+        self._hash_credentials()
+        # the cached all-stocks list alongside the set of interned symbols built from it
+        self._all_stocks: Optional[TupleType[ListType[str], SetType[str]]] = None
 
+    @property
+    def token(self) -> str:
+        """The API token used to authenticate requests."""
+        return self._credentials["token"]
+
+    @token.setter
     @beartype
-    def _base_request(
-        self, endpoint: str, params: Optional[JSONType] = None
-    ) -> JSONType:
-        """Make a request to a specific REST endpoint on the SentimentInvestor API.
+    def token(self, token: str) -> None:
+        self._credentials["token"] = token
+        self._hash_credentials()
+
+    @property
+    def key(self) -> str:
+        """The API key used to authenticate requests."""
+        return self._credentials["key"]
+
+    @key.setter
+    @beartype
+    def key(self, key: str) -> None:
+        self._credentials["key"] = key
+        self._hash_credentials()
+
+    @beartype
+    def _hash_credentials(self) -> None:
+        # cached responses depend on the account, so they are keyed by a digest of the credentials
+        # computed here, whenever the credentials change, rather than on every cached request
+        self._account = hashlib.sha256(
+            f"{self._credentials['token']}:{self._credentials['key']}".encode("utf-8")
+        ).hexdigest()
+
+    @beartype
+    def _request(
+        self, endpoint: str, params: Optional[JSONType] = None, stream: bool = False
+    ) -> requests.Response:
+        """Send a GET request to a specific REST endpoint on the SentimentInvestor API.
 
         Args:
             endpoint: the REST endpoint (final fragment in URL)
             params: any supplementary parameters to pass to the API
+            stream: whether to defer downloading the response body
 
-        Returns: the JSON response if the request was successful, otherwise an exception is raised.
+        Returns: the (unchecked) response from the API.
+        """
+        return self._session.get(
+            self._urls[endpoint], params=params, stream=stream, timeout=self.timeout
+        )
 
+    @staticmethod
+    @beartype
+    def _parse_response(content: bytes, status_code: int) -> JSONType:
+        """Parse the body of an API response, raising an exception if the request failed.
+
+        Args:
+            content: the raw response body
+            status_code: the HTTP status code of the response
+
+        Returns: the decoded JSON response if the request was successful, otherwise an exception is raised.
         """
-        if params is None:
-            params = {}
-        url = self.base_url + endpoint
-        params["token"] = self.token
-        params["key"] = self.key
-        response = requests.get(url, params)
-        if (
-            response.content.decode("utf-8") == "invalid_parameter"
-            or response.content.decode("utf-8") == "incorrect_key"
-        ):
+        # rejected credentials are recognisable from the status alone, without inspecting the body
+        if status_code in _AUTH_ERROR_STATUSES or content in _AUTH_ERRORS:
             raise ValueError("Incorrect key or token")
         else:
             try:
-                data = response.json()
-            except json.JSONDecodeError:
-                raise Exception(response.text)
+                # parse the raw bytes directly rather than decoding them to a string first
+                data = json_loads(content)
+            except ValueError:
+                raise Exception(content.decode("utf-8", "replace"))
 
-            if response.ok:
+            if status_code < 400:
                 return data
             else:
                 raise Exception(data["message"])
 
+    @beartype
+    def _base_request(
+        self, endpoint: str, params: Optional[JSONType] = None
+    ) -> JSONType:
+        """Make a request to a specific REST endpoint on the SentimentInvestor API.
+
+        Args:
+            endpoint: the REST endpoint (final fragment in URL)
+            params: any supplementary parameters to pass to the API
+
+        Returns: the JSON response if the request was successful, otherwise an exception is raised.
+
+        """
+        response = self._request(endpoint, params)
+        return self._parse_response(response.content, response.status_code)
+
+    @beartype
+    def _cached_request(
+        self,
+        endpoint: str,
+        params: Optional[JSONType] = None,
+        ttl: Optional[float] = None,
+    ) -> JSONType:
+        """Make a request like `_base_request`, reusing a previous response while it is fresh.
+
+        Only use this for endpoints whose data changes slowly.
+
+        Args:
+            endpoint: the REST endpoint (final fragment in URL)
+            params: any supplementary parameters to pass to the API
+            ttl: how many seconds to reuse the response for, `cache_ttl` by default
+
+        Returns: the JSON response if the request was successful, otherwise an exception is raised.
+        """
+        # clients with other credentials must not share responses
+        key = (
+            (endpoint, self._account, *sorted(params.items()))
+            if params
+            else (endpoint, self._account)
+        )
+        data = self._cache.get(key)
+        if data is None:
+            data = self._base_request(endpoint, params)
+            self._cache.set(key, data, self.cache_ttl if ttl is None else ttl)
+        return data
+
+    @beartype
+    def clear_cache(self) -> None:
+        """Forget all cached responses, so that the next calls fetch fresh data from the API.
+
+        .. versionadded:: 2.2.0
+        """
+        self._cache.clear()
+
+    @beartype
+    def _iter_base_request(
+        self,
+        endpoint: str,
+        params: Optional[JSONType] = None,
+        prefix: str = "results.item",
+    ) -> IteratorType[Any]:
+        """Make a request to a REST endpoint and lazily yield the items found under `prefix`.
+
+        If ijson's C backend is installed, the response body is parsed incrementally as it is downloaded,
+        so the whole payload never has to be held in memory at once.
+        Otherwise, this falls back to parsing the full response.
+
+        Args:
+            endpoint: the REST endpoint (final fragment in URL)
+            params: any supplementary parameters to pass to the API
+            prefix: the ijson prefix of the array items to yield, e.g. ``"results.item"`` for each entry in ``results``
+
+        Returns: an iterator over the selected items in the JSON response.
+
+        Raises:
+            KeyError: if the response has no array at `prefix`, whether or not it is parsed incrementally
+        """
+        if ijson_items is None:
+            data = self._base_request(endpoint, params)
+        else:
+            with self._request(endpoint, params, stream=True) as response:
+                chunks = response.iter_content(chunk_size=64 * 1024)
+                first = next(chunks, b"")
+                # errors are not JSON objects, so only stream what looks like a successful response
+                if response.ok and first.lstrip()[:1] == b"{":
+                    body = _ChunkReader(itertools.chain([first], chunks))
+                    for item in ijson_items(body, prefix, use_float=True):
+                        # the prefix exists, so the start of the body is not needed any more
+                        body.consumed = None
+                        yield item
+                    if body.consumed is None:
+                        return
+                    # nothing matched, so check the prefix below exactly as without ijson
+                    data = json_loads(b"".join(body.consumed))
+                else:
+                    data = self._parse_response(
+                        first + b"".join(chunks), response.status_code
+                    )
+
+        # walk the already-parsed response the same way ijson interprets the prefix
+        node: Any = data
+        for key in prefix.split(".")[:-1]:
+            node = node[key]
+        yield from node
+
     @beartype
     def parsed(self, symbol: str) -> _ApiResult:
         """The parsed data endpoints provides the four core metrics for a stock: AHI, RHI, SGP and sentiment.
@@ -135,7 +535,7 @@ class Sentipy:
         .. versionadded:: 2.0.0
         """
         params = {"symbol": symbol}
-        return _ApiResult(self._base_request("parsed", params=params))
+        return _ApiResult._from_trusted(self._base_request("parsed", params=params))
 
     @beartype
     def raw(self, symbol: str) -> _ApiResult:
@@ -149,10 +549,72 @@ class Sentipy:
         .. versionadded:: 2.0.0
         """
         params = {"symbol": symbol}
-        return _ApiResult(self._base_request("raw", params=params))
+        return _ApiResult._from_trusted(self._base_request("raw", params=params))
+
+    @beartype
+    def _fan_out(
+        self,
+        request: Callable[[str], _ApiResult],
+        symbols: IterableType[str],
+        max_workers: int,
+    ) -> ListType[_ApiResult]:
+        """Call a per-symbol endpoint for several symbols concurrently.
+
+        Args:
+            request: the bound endpoint method to call for each symbol
+            symbols: the symbols to request data for
+            max_workers: the maximum number of requests in flight at once
+
+        Returns: the results in the same order as `symbols`
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(request, symbols))
+
+    @beartype
+    def parsed_many(
+        self, symbols: IterableType[str], max_workers: int = 16
+    ) -> ListType[_ApiResult]:
+        """Get parsed data for several stocks, issuing the requests concurrently.
+
+        Prefer this to calling `parsed` in a loop, which waits for each response before sending the next request.
+
+        Args:
+            symbols: tickers or symbols of the stocks to request data for
+            max_workers: the maximum number of requests in flight at once
+
+        Returns: a list of QuoteData objects, in the same order as `symbols`
+
+        Examples:
+            >>> for data in sentipy.parsed_many(["AAPL", "TSLA"]):
+            ...     print(data.symbol, data.AHI)
+            ...
+            AAPL 0.8478140394088669
+            TSLA 1.0360997732426305
+
+        .. versionadded:: 2.2.0
+        """
+        return self._fan_out(self.parsed, symbols, max_workers)
+
+    @beartype
+    def raw_many(
+        self, symbols: IterableType[str], max_workers: int = 16
+    ) -> ListType[_ApiResult]:
+        """Get raw data for several stocks, issuing the requests concurrently.
+
+        Prefer this to calling `raw` in a loop, which waits for each response before sending the next request.
+
+        Args:
+            symbols: tickers or symbols of the stocks to request data for
+            max_workers: the maximum number of requests in flight at once
+
+        Returns: a list of QuoteData objects, in the same order as `symbols`
+
+        .. versionadded:: 2.2.0
+        """
+        return self._fan_out(self.raw, symbols, max_workers)
 
     @beartype
-    def quote(self, symbol: str, enrich: bool = False) -> _ApiResult:
+    def quote(self, symbol: str, enrich: bool = False) -> _QuoteRecord:
         """The quote data endpoint provides access to all realtime data about stocks along with further data if requested.
 
         Args:
@@ -161,6 +623,9 @@ class Sentipy:
 
         Returns: a QuoteData object
 
+        .. tip:: to get quotes for more than one stock, prefer `quote_many`,
+            which makes one request for all of them instead of one request per stock.
+
         Examples:
             >>> quote_data = sentipy.quote("TSLA", enrich=True)
             >>> print([var for var in dir(quote_data) if not var.startswith("_")])
@@ -199,17 +664,23 @@ class Sentipy:
                                             'wallstreetbets': 0.5}}
         """
         params = {"symbol": symbol, "enrich": enrich}
-        return _ApiResult(self._base_request("quote", params=params))
+        return _QuoteRecord(self._base_request("quote", params=params))
 
     @beartype
-    def sort(self, metric: str, limit: int) -> ListType[_ApiResponse]:
+    def sort(
+        self, metric: str, limit: int, as_frame: bool = False
+    ) -> Union[ListType[_ApiResponse], DataFrameType]:
         """The sort data endpoint provides access to ordered rankings of stocks across core metrics.
 
         Args:
             metric: the metric by which to sort the stocks
             limit: the maximum number of stocks to return
+            as_frame: whether to return a pandas DataFrame with one column per metric (requires pandas)
+
+        Returns: a list of TickerData objects, or a DataFrame with one row per stock if `as_frame` is set
 
-        Returns: a list of TickerData objects
+        Raises:
+            ValueError: if `metric` is not provided by the API
 
         Examples:
             >>> metric = "AHI"
@@ -223,11 +694,12 @@ class Sentipy:
             {'AHI': 1.3133928571428573, 'RHI': 1.0435689663713186, 'rank': 2, 'reddit_comment_mentions': 58, 'reddit_post_mentions': 0, 'sentiment': 0.7033474218089603, 'stocktwits_post_mentions': 262, 'subreddits': {'symbol': 'SPY'}, 'symbol': 'SPY', 'tweet_mentions': 20, 'yahoo_finance_comment_mentions': 3}
             {'AHI': 0.8098830049261084, 'RHI': 1.4870815942458393, 'rank': 3, 'reddit_comment_mentions': 62, 'reddit_post_mentions': 0, 'sentiment': 0.7574809805579037, 'stocktwits_post_mentions': 113, 'subreddits': {'symbol': 'AAPL'}, 'symbol': 'AAPL', 'tweet_mentions': 20, 'yahoo_finance_comment_mentions': 13}
         """
+        _check_metric(metric)
         params = {"metric": metric, "limit": limit}
-        return [
-            _ApiResponse(dp)
-            for dp in self._base_request("sort", params=params).get("results")
-        ]
+        results = self._iter_base_request("sort", params=params)
+        if as_frame:
+            return _to_frame(results)
+        return [_ApiResponse._from_trusted(dp) for dp in results]
 
     @beartype
     def historical(
@@ -243,6 +715,12 @@ class Sentipy:
 
         Returns (dict): a dictionary of (timestamp -> data entry) mappings.
 
+        Raises:
+            ValueError: if `metric` is not provided by the API
+
+        .. note:: data for ranges that ended over an hour ago is cached for `historical_cache_ttl` seconds,
+            see `clear_cache`.
+
         Examples:
             >>> historical_data = sentipy.historical("AAPL", "RHI", 1614556869, 1619654469)
             >>> for timestamp, value in sorted(historical_data.items()):
@@ -254,50 +732,212 @@ class Sentipy:
             (...lots of lines omitted)
 
         """
+        _check_metric(metric)
+        params = {"symbol": symbol, "metric": metric, "start": start, "end": end}
+        # data for a range that ended a while ago will not change any more
+        if end < time.time() - 60 * 60:
+            response = self._cached_request(
+                "historical", params=params, ttl=self.historical_cache_ttl
+            )
+            return dict(map(_timestamp_and_data, response["results"]))
+        return dict(self._historical_pairs(params))
+
+    @beartype
+    def _historical_pairs(
+        self, params: JSONType
+    ) -> IteratorType[TupleType[Union[int, float], Union[int, float]]]:
+        return map(_timestamp_and_data, self._iter_base_request("historical", params))
+
+    @beartype
+    def historical_iter(
+        self, symbol: str, metric: str, start: int, end: int
+    ) -> IteratorType[TupleType[Union[int, float], Union[int, float]]]:
+        """Lazily get historical data for a stock, one data point at a time.
+
+        With the ``fast`` extra installed, data points are yielded while the response is still downloading,
+        so long ranges never have to be held in memory at once. Unlike `historical`, nothing is cached.
+
+        Args:
+            symbol: the stock to look up historical data for
+            metric: the metric for which to return data
+            start: Unix epoch timestamp in seconds specifying start of date range
+            end: Unix epoch timestamp in seconds specifying end of date range
+
+        Returns: an iterator of (timestamp, data entry) pairs
+
+        Raises:
+            ValueError: if `metric` is not provided by the API
+
+        Examples:
+            >>> peak = max(value for _, value in sentipy.historical_iter("AAPL", "RHI", 1614556869, 1619654469))
+
+        .. versionadded:: 2.2.0
+        """
+        _check_metric(metric)
         params = {"symbol": symbol, "metric": metric, "start": start, "end": end}
-        return {
-            dp.get("timestamp"): dp.get("data")
-            for dp in self._base_request("historical", params=params).get("results")
-        }
+        return self._historical_pairs(params)
+
+    @beartype
+    def historical_arrays(
+        self, symbol: str, metric: str, start: int, end: int
+    ) -> TupleType[NDArrayType, NDArrayType]:
+        """Get historical data for a stock as a pair of NumPy arrays, ready for vectorised analysis.
+
+        The data is streamed straight into the arrays, without building a dictionary first. Nothing is cached.
+
+        Args:
+            symbol: the stock to look up historical data for
+            metric: the metric for which to return data
+            start: Unix epoch timestamp in seconds specifying start of date range
+            end: Unix epoch timestamp in seconds specifying end of date range
+
+        Returns: contiguous float64 arrays of the timestamps and of the corresponding data entries
+
+        Raises:
+            ValueError: if `metric` is not provided by the API
+            ImportError: if NumPy is not installed
+
+        Examples:
+            >>> timestamps, values = sentipy.historical_arrays("AAPL", "RHI", 1614556869, 1619654469)
+            >>> mean_rhi = values.mean()
+
+        .. versionadded:: 2.2.0
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "historical_arrays requires NumPy, install it with `pip install sentiment-investor[numpy]`"
+            ) from None
+        pairs = self.historical_iter(symbol, metric, start, end)
+        flat = numpy.fromiter(itertools.chain.from_iterable(pairs), dtype=numpy.float64)
+        timestamps, values = flat.reshape(-1, 2).T
+        return numpy.ascontiguousarray(timestamps), numpy.ascontiguousarray(values)
 
     @beartype
     def bulk(
-        self, symbols: ListType[str], enrich: bool = False
-    ) -> ListType[_ApiResponse]:
+        self,
+        symbols: ListType[str],
+        enrich: bool = False,
+        as_frame: bool = False,
+        chunk_size: int = 100,
+        max_workers: int = 8,
+    ) -> Union[ListType[_QuoteRecord], DataFrameType]:
         """Get quote data for several stocks simultaneously.
 
+        Long lists of symbols are split into chunks of `chunk_size`, which are requested concurrently.
+
         Args:
             symbols: list of stocks to get quote data for
             enrich: whether to get enriched data
+            as_frame: whether to return a pandas DataFrame with one column per metric (requires pandas)
+            chunk_size: the maximum number of symbols to send in a single request
+            max_workers: the maximum number of chunk requests in flight at once
 
-        Returns: a list of TickerData objects
+        Returns: a list of TickerData objects, or a DataFrame with one row per stock if `as_frame` is set
+
+        Raises:
+            ValueError: if `chunk_size` or `max_workers` is less than 1
 
         .. versionadded:: 2.0.0
+
+        .. versionchanged:: 2.2.0
+            Added the `chunk_size` and `max_workers` arguments.
         """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, not {max_workers}")
+
+        results: IterableType[JSONType]
+        if len(symbols) <= chunk_size:
+            results = self._bulk_chunk(symbols, enrich)
+        else:
+            chunks = [
+                symbols[i : i + chunk_size] for i in range(0, len(symbols), chunk_size)
+            ]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                parts = list(
+                    executor.map(self._bulk_chunk, chunks, [enrich] * len(chunks))
+                )
+            results = itertools.chain.from_iterable(parts)
+        if as_frame:
+            return _to_frame(results)
+        return [_QuoteRecord(result) for result in results]
+
+    @beartype
+    def _bulk_chunk(self, symbols: ListType[str], enrich: bool) -> ListType[JSONType]:
         params = {"symbols": ",".join(symbols), "enrich": enrich}
-        return [
-            _ApiResponse(result)
-            for result in self._base_request("bulk", params=params).get("results")
-        ]
+        return list(self._iter_base_request("bulk", params=params))
 
     @beartype
-    def all(self, enrich: bool = False) -> ListType[_ApiResponse]:
+    def quote_many(
+        self, symbols: IterableType[str], enrich: bool = False
+    ) -> DictType[str, _QuoteRecord]:
+        """Get quote data for several stocks in a single request, see `bulk`.
+
+        Args:
+            symbols: tickers or symbols of the stocks to request data for
+            enrich: whether to request enriched data
+
+        Returns: a dictionary of (symbol -> QuoteData object) mappings
+
+        Examples:
+            >>> quotes = sentipy.quote_many(["AAPL", "TSLA", "PYPL"])
+            >>> print(quotes["TSLA"].AHI)
+            1.2302925391095734
+
+        .. versionadded:: 2.2.0
+        """
+        quotes: ListType[_QuoteRecord] = self.bulk(list(symbols), enrich)
+        return {quote.symbol: quote for quote in quotes}
+
+    @beartype
+    def all(
+        self, enrich: bool = False, as_frame: bool = False
+    ) -> Union[ListType[_QuoteRecord], DataFrameType]:
         """Get all data for all stocks simultaneously.
 
         .. note:: this blocking call takes a long time to execute.
+            Use `all_iter` to process stocks as they arrive instead.
 
         Args:
             enrich: whether to fetch enriched data
+            as_frame: whether to return a pandas DataFrame with one column per metric (requires pandas)
 
-        Returns: a list of TickerData objects
+        Returns: a list of TickerData objects, or a DataFrame with one row per stock if `as_frame` is set
+
+        Examples:
+            >>> frame = sentipy.all(as_frame=True)
+            >>> frame.nlargest(3, "AHI")["symbol"].tolist()
+            ['AMC', 'ET', 'SPY']
 
         .. versionadded:: 2.0.0
         """
+        if as_frame:
+            return _to_frame(self._iter_base_request("all", params={"enrich": enrich}))
+        return list(self.all_iter(enrich))
+
+    @beartype
+    def all_iter(self, enrich: bool = False) -> IteratorType[_QuoteRecord]:
+        """Lazily get all data for all stocks, one stock at a time.
+
+        With the ``fast`` extra installed, stocks are yielded while the response is still downloading,
+        so memory use stays flat no matter how many stocks are returned.
+
+        Args:
+            enrich: whether to fetch enriched data
+
+        Returns: an iterator of TickerData objects
+
+        Examples:
+            >>> hyped = [stock.symbol for stock in sentipy.all_iter() if stock.AHI > 1.5]
+
+        .. versionadded:: 2.2.0
+        """
         params = {"enrich": enrich}
-        return [
-            _ApiResponse(result)
-            for result in self._base_request("all", params=params).get("results")
-        ]
+        # thousands of stocks are returned, so store them compactly
+        return map(_QuoteRecord, self._iter_base_request("all", params=params))
 
     @beartype
     def supported(self, symbol: str) -> bool:
@@ -308,6 +948,8 @@ class Sentipy:
 
         Returns: boolean whether supported or not
 
+        .. note:: responses are cached for `cache_ttl` seconds, see `clear_cache`.
+
         Examples:
             >>> for stock in ["AAPL", "TSLA", "SNTPY"]:
             ...     print(f"{stock} {'is' if sentipy.supported(stock) else 'is not'} supported.")
@@ -319,7 +961,7 @@ class Sentipy:
         .. versionadded:: 2.0.0
         """
         # Assume results always returns a bool
-        return self._base_request("supported", params={"symbol": symbol}).get("results")  # type: ignore[no-any-return]
+        return self._cached_request("supported", params={"symbol": symbol}).get("results")  # type: ignore[no-any-return]
 
     @beartype
     def all_stocks(self) -> SetType[str]:
@@ -327,9 +969,16 @@ class Sentipy:
 
         Returns (set[str]): list of stock symbols
 
+        .. note:: responses are cached for `cache_ttl` seconds, see `clear_cache`.
+
         .. versionadded:: 2.0.0
         """
-        return set(self._base_request("all-stocks").get("results"))
+        results = self._cached_request("all-stocks")["results"]
+        # only rebuild the set when the cached response has been refreshed
+        if self._all_stocks is None or self._all_stocks[0] is not results:
+            self._all_stocks = results, set(map(sys.intern, results))
+        # copying a set reuses the stored hashes, and keeps callers from modifying ours
+        return set(self._all_stocks[1])
 
     # mypy doesn't support decorated properties
     @property  # type: ignore[misc]
@@ -340,7 +989,7 @@ class Sentipy:
         Returns:
             The api response about the user's account
         """
-        return _ApiResponse(self._base_request("account"))
+        return _ApiResponse._from_trusted(self._base_request("account"))
 
     @property  # type: ignore[misc]
     @beartype
@@ -351,3 +1000,24 @@ class Sentipy:
             The user's api token and key
         """
         return self.token, self.key
+
+    @beartype
+    def close(self) -> None:
+        """Close any connections to the API kept open by this instance.
+
+        Examples:
+            >>> with Sentipy(token=token, key=key) as sentipy:
+            ...     quote_data = sentipy.quote("TSLA")
+            ...
+
+        .. versionadded:: 2.2.0
+        """
+        self._session.close()
+
+    def __enter__(self) -> "Sentipy":
+        """Use this instance as a context manager that closes its connections on exit."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close this instance's connections, see `close`."""
+        self.close()
@@ -3,35 +3,52 @@
 For more information, please visit https://docs.sentimentinvestor.com/RESTful/websocket
 """
 
-# TODO: Refactor to use the threading library
-import _thread as thread
-import datetime
 import json
 import logging
+import queue
 import sys
-from typing import Callable, Optional
-
-from beartype import beartype
+import threading
+import time
+from typing import Any, Callable, Optional
 
 # websocket comes with no type hints
 from websocket import WebSocketApp  # type: ignore[import]
 
-from ._typing_imports import DictType, IterableType
+from ._compat import beartype, json_loads
+from ._typing_imports import DictType, IterableType, JSONType, ListType
+
+_logger = logging.getLogger(__name__)
+
+# The websocket event handlers and StockUpdateData run for every message received,
+# so they are not wrapped in beartype's runtime checks
 
 
 # Defined at the top since it's used in type annotations
 class StockUpdateData:
     """A new data container for the stock update."""
 
-    @beartype
     def __init__(self, message: str) -> None:
         """Defines attributes from the message for the new container.
 
         Args:
             message: A JSON string returned by the websocket server
         """
-        for k, v in json.loads(message).items():
-            setattr(self, k, v)
+        self.__dict__.update(json_loads(message))
+
+    @classmethod
+    def from_dict(cls, data: JSONType) -> "StockUpdateData":
+        """Create a container from a message that has already been parsed.
+
+        Args:
+            data: the decoded JSON object sent by the websocket server
+
+        Returns: a new container with an attribute for each field in `data`
+
+        .. versionadded:: 2.2.0
+        """
+        update: StockUpdateData = cls.__new__(cls)
+        update.__dict__.update(data)
+        return update
 
 
 # Used to add type annotations for callable arguments
@@ -46,106 +63,192 @@ class _Stream:
     WebSocket url to connect to
     """
 
-    __params: DictType[str, str] = {}
+    reconnect_delay = 1.0
+    """
+    How many seconds to wait before reconnecting, doubled after each connection that fails to authenticate
+    """
+
+    max_reconnect_delay = 60.0
+    """
+    The longest to wait before reconnecting, in seconds
+    """
+
     __ws = None
 
     @beartype
     def __init__(
-        self, token: str, key: str, callback: CallableType, fragment: str
+        self,
+        token: str,
+        key: str,
+        callback: CallableType,
+        fragment: str,
+        symbols: Optional[ListType[str]] = None,
     ) -> None:
         """Initialise a new web socket stream.
 
         Args:
             token: SentimentInvestor API token
             key: SentimentInvestor API key
-            callback: function accepting one argument of type `StockUpdateData` that is called when data is received
+            callback: function accepting one argument of type `StockUpdateData` that is called when data is received,
+                from a background thread
             fragment: the websocket endpoint to contact
+            symbols: the symbols to subscribe to, if the endpoint takes any
 
         Raises:
             ValueError: if token or key is omitted
         """
-        self.__params["key"] = key
-        self.__params["token"] = token
+        # authentication token and key + any necessary parameters
+        params: DictType[str, Any] = {"key": key, "token": token}
+        if symbols is not None:
+            params["symbols"] = symbols
 
         self.__user_callback = callback
         self.__fragment = fragment
+        # serialised once, then resent unchanged every time the socket (re)connects
+        self.__auth_payload = json.dumps(params)
+        self.__authenticated = False
+
+        # stock updates are parsed and passed to the callback on a worker thread,
+        # so that the websocket thread can go straight back to reading frames
+        self.__messages: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        threading.Thread(
+            target=self.__dispatch, name="sentipy-ws-dispatch", daemon=True
+        ).start()
 
         self.__connect()
 
-    @beartype
     def __send_key(self, *args: str) -> None:
         if self.__ws is None:
             return
-        # send authentication token and key + any necessary parameters
-        self.__ws.send(json.dumps(self.__params))
+        # send the authentication payload built in __init__
+        self.__ws.send(self.__auth_payload)
 
-    @beartype
     def __on_open(self, ws: WebSocketApp) -> None:
-        logging.info("WebSocket opened")
-        thread.start_new_thread(self.__send_key, ())
-
-    @beartype
-    def __on_error(self, ws: WebSocketApp, error: str) -> None:
-        logging.error(f"WebSocket error {error}")
+        _logger.info("WebSocket opened")
+        # a single small write, so there is no need for a separate thread
+        self.__send_key()
+
+    def __on_error(self, ws: WebSocketApp, error: BaseException) -> None:
+        if isinstance(error, KeyboardInterrupt):
+            # run_forever swallows the interrupt, so stop the reconnect loop here and exit once it ends
+            self.__running = False
+            self.__interrupted = True
+            return
+        _logger.error("WebSocket error %s", error)
 
-    @beartype
     def __on_close(
         self, ws: WebSocketApp, close_status_code: int, close_msg: str
     ) -> None:
-        logging.warning(
-            f"WebSocket closed with status code {close_status_code}. Info provided: {close_msg}"
+        _logger.warning(
+            "WebSocket closed with status code %s. Info provided: %s",
+            close_status_code,
+            close_msg,
         )
 
-        # reconnect
-        self.__ws = None
-        try:
-            self.__connect()
-        except KeyboardInterrupt:
-            logging.info("Not reconnecting WebSocket")
-            sys.exit()
-
-    @beartype
     def __on_message(self, ws: WebSocketApp, message: str) -> None:
-        logging.debug(message)
-        response = json.loads(message)
-        if "authState" in response:
-            # notify the client if authentication unsuccessful
-            if not response["authState"]:
-                raise ValueError("Not authenticated or invalid request")
-            else:
-                time_formatted = datetime.datetime.utcfromtimestamp(
-                    response["timestamp"] / 1000
-                ).strftime("%Y-%m-%d %H:%M:%S")
-                logging.info(
-                    f"WebSocket authentication successful as of {time_formatted}"
-                )
-                logging.info(
-                    f"Subscribed to the following stocks: {', '.join(response['subscribedTo'])}"
-                )
-        else:
-            self.__user_callback(StockUpdateData(message))
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(message)
+        # stock updates only need checking for the authentication state until it has arrived
+        if self.__authenticated:
+            self.__messages.put(message)
+            return
+
+        response = json_loads(message)
+        if "authState" not in response:
+            self.__messages.put(message)
+            return
+
+        # notify the client if authentication unsuccessful
+        if not response["authState"]:
+            raise ValueError("Not authenticated or invalid request")
+        self.__authenticated = True
+        # the server is reachable again, so the next disconnection starts backing off afresh
+        self.__delay = self.reconnect_delay
+        if _logger.isEnabledFor(logging.INFO):
+            t = time.gmtime(response["timestamp"] // 1000)
+            time_formatted = (
+                f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} "
+                f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            )
+            _logger.info("WebSocket authentication successful as of %s", time_formatted)
+            # the list covers every stock for AllStocksStream, so only show the start of it
+            subscribed = response["subscribedTo"]
+            _logger.info(
+                "Subscribed to %d stocks: %s%s",
+                len(subscribed),
+                ", ".join(subscribed[:20]),
+                ", ..." if len(subscribed) > 20 else "",
+            )
+
+    def __dispatch(self) -> None:
+        while True:
+            # wait for one message, then take any others that have queued up behind it
+            messages = [self.__messages.get()]
+            try:
+                while True:
+                    messages.append(self.__messages.get_nowait())
+            except queue.Empty:
+                pass
+
+            for message in messages:
+                if message is None:
+                    # __connect has given up, so no more messages will arrive
+                    return
+                try:
+                    update = StockUpdateData.from_dict(json_loads(message))
+                    self.__user_callback(update)
+                except Exception:
+                    # keep dispatching later updates if one fails
+                    _logger.exception("Failed to handle WebSocket message")
 
     @beartype
     def __connect(self) -> None:
+        # reconnect in a loop rather than from on_close, so the stack doesn't grow with every reconnection
+        self.__running = True
+        self.__interrupted = False
+        self.__delay = self.reconnect_delay
+        try:
+            while self.__running:
+                # every new connection authenticates again
+                self.__authenticated = False
+
+                # initialise websocket
+                self.__ws = WebSocketApp(
+                    self.base_url + self.__fragment,
+                    on_open=self.__on_open,
+                    on_error=self.__on_error,
+                    on_close=self.__on_close,
+                    on_message=self.__on_message,
+                )
 
-        # initialise websocket
-        self.__ws = WebSocketApp(
-            self.base_url + self.__fragment,
-            on_open=self.__on_open,
-            on_error=self.__on_error,
-            on_close=self.__on_close,
-            on_message=self.__on_message,
-        )
+                self.__ws.run_forever(
+                    ping_interval=30, ping_timeout=10, ping_payload="ping"
+                )
+                self.__ws = None
 
-        self.__ws.run_forever(ping_interval=30, ping_timeout=10, ping_payload="ping")
+                if self.__running:
+                    # back off exponentially rather than hammering a server that is down
+                    time.sleep(self.__delay)
+                    self.__delay = min(self.__delay * 2, self.max_reconnect_delay)
+        except KeyboardInterrupt:
+            # interrupted while waiting to reconnect
+            self.__interrupted = True
+        finally:
+            # let the dispatch thread finish delivering what is queued, then exit
+            self.__messages.put(None)
+        _logger.info("Not reconnecting WebSocket")
+        if self.__interrupted:
+            sys.exit()
 
     @beartype
     def reconnect(self) -> None:
         """Manually request a websocket reconnection.
 
+        This closes the current connection, after which a new one is opened.
         This should not usually be necessary as SentiPy will try to reconnect automatically if connection is lost.
         """
-        self.__connect()
+        if self.__ws is not None:
+            self.__ws.close()
 
 
 class StocksStream(_Stream):
@@ -168,8 +271,13 @@ class StocksStream(_Stream):
             callback: a function taking one argument, a StockUpdateData object,
             that will be called when a stock update is received
         """
-        self.__params["symbols"] = list(symbols) if symbols is not None else []
-        super().__init__(token, key, callback, "stocks")
+        super().__init__(
+            token,
+            key,
+            callback,
+            "stocks",
+            list(symbols) if symbols is not None else [],
+        )
 
 
 class AllStocksStream(_Stream):
@@ -1,15 +1,37 @@
 """Tests various methods of the SentiPy module."""
 
+import asyncio
+import json
 import os
+import sys
+import tempfile
+import threading
+import time
 import unittest
+from operator import attrgetter
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
 
 # vcrpy is untyped
 # Therefore, ignore all vcr decorators
 import vcr  # type: ignore[import]
 from beartype import beartype
 
-from sentipy._typing_imports import ListType
-from sentipy.sentipy import Sentipy
+from sentipy._cache import TTLCache
+from sentipy._typing_imports import ListType, TupleType
+from sentipy.async_sentipy import AsyncSentipy
+from sentipy.sentipy import Sentipy, _check_metric, _QuoteRecord
+from sentipy.ws import StocksStream, _Stream
+
+# JSON cassettes load far faster than YAML ones
+# Responses are stored decompressed, as the JSON serializer can't store binary bodies
+my_vcr = vcr.VCR(
+    cassette_library_dir="vcr_cassettes",
+    serializer="json",
+    decode_compressed_response=True,
+)
 
 
 class SentipyTestCase(unittest.TestCase):
@@ -17,22 +39,25 @@ class SentipyTestCase(unittest.TestCase):
 
     sentipy: Sentipy
 
+    @classmethod
     @beartype
-    def setUp(self) -> None:
-        """Checks whether the key and token have been defined, and then authenticates."""
+    def setUpClass(cls) -> None:
+        """Checks whether the key and token have been defined, and then authenticates once for all tests."""
         sentipy_key = os.getenv("API_SENTIMENTINVESTOR_KEY")
         sentipy_token = os.getenv("API_SENTIMENTINVESTOR_TOKEN")
 
         # Makes the sentipy args str rather than Optional[str]
         if sentipy_key is None or sentipy_token is None:
-            self.fail(
+            raise cls.failureException(
                 "API_SENTIMENTINVESTOR_KEY or API_SENTIMENTINVESTOR_TOKEN is not set"
             )
 
-        self.sentipy = Sentipy(
+        cls.sentipy = Sentipy(
             key=sentipy_key,
             token=sentipy_token,
         )
+        # vcrpy can only decompress gzip and deflate responses before recording them
+        cls.sentipy._session.headers["Accept-Encoding"] = "gzip, deflate"
 
     @beartype
     def assertHasAttr(self, object: object, attr: str) -> None:
@@ -60,8 +85,10 @@ class SentipyTestCase(unittest.TestCase):
         Raises:
             AssertionError: If any of the attributes aren't in the object
         """
-        for attr in attrs:
-            self.assertHasAttr(object, attr)
+        try:
+            attrgetter(*attrs)(object)
+        except AttributeError as e:
+            self.fail(f"{object!r} is missing an attribute: {e}")
 
     @beartype
     def check_basics(self, data: object) -> None:
@@ -77,7 +104,7 @@ class SentipyTestCase(unittest.TestCase):
         self.assertTrue(data.success)  # type: ignore[attr-defined]
         self.assertHasAttr(data, "symbol")
 
-    @vcr.use_cassette("vcr_cassettes/parsed.yml")  # type: ignore[misc]
+    @my_vcr.use_cassette("parsed.json")  # type: ignore[misc]
     @beartype
     def test_parsed(self) -> None:
         """Tests SentiPy's `parsed` method."""
@@ -85,7 +112,17 @@ class SentipyTestCase(unittest.TestCase):
         self.check_basics(data)
         self.assertHasAttrs(data, ["sentiment", "AHI", "RHI", "SGP"])
 
-    @vcr.use_cassette("vcr_cassettes/raw.yml")  # type: ignore[misc]
+    @my_vcr.use_cassette("parsed_many.json")  # type: ignore[misc]
+    @beartype
+    def test_parsed_many(self) -> None:
+        """Tests SentiPy's `parsed_many` method."""
+        data = self.sentipy.parsed_many(["AAPL", "TSLA"])
+        self.assertEqual([stock.symbol for stock in data], ["AAPL", "TSLA"])  # type: ignore[attr-defined]
+        for stock in data:
+            self.check_basics(stock)
+            self.assertHasAttrs(stock, ["sentiment", "AHI", "RHI", "SGP"])
+
+    @my_vcr.use_cassette("raw.json")  # type: ignore[misc]
     @beartype
     def test_raw(self) -> None:
         """Tests SentiPy's `raw` method."""
@@ -107,7 +144,7 @@ class SentipyTestCase(unittest.TestCase):
             ],
         )
 
-    @vcr.use_cassette("vcr_cassettes/quote.yml")  # type: ignore[misc]
+    @my_vcr.use_cassette("quote.json")  # type: ignore[misc]
     def test_quote(self) -> None:
         """Tests SentiPy's `quote` method."""
         data = self.sentipy.quote("AAPL")
@@ -132,11 +169,13 @@ class SentipyTestCase(unittest.TestCase):
             ],
         )
 
-    @vcr.use_cassette("vcr_cassettes/bulk.yml")  # type: ignore[misc]
+    @my_vcr.use_cassette("bulk.json")  # type: ignore[misc]
     @beartype
     def test_bulk(self) -> None:
         """Tests SentiPy's `bulk` method."""
         data = self.sentipy.bulk(["AAPL", "TSLA", "PYPL"])
+        # a plain assert, unlike assertIsInstance, narrows the list-or-DataFrame return type for mypy
+        assert isinstance(data, list)
         self.assertEqual(len(data), 3)
         for stock in data:
             self.assertHasAttrs(
@@ -160,5 +199,402 @@ class SentipyTestCase(unittest.TestCase):
             )
 
 
+class OfflineTestCase(unittest.TestCase):
+    """Tests for the parts of SentiPy that can run without the API."""
+
+    @beartype
+    def setUp(self) -> None:
+        """Creates a client with dummy credentials, which never reaches the API."""
+        self.sentipy = Sentipy(key="key", token="token")
+
+    @beartype
+    def run_stream(
+        self, outcomes: ListType[str]
+    ) -> TupleType[ListType[str], ListType[str], ListType[float]]:
+        """Runs a StocksStream against scripted connections until it is interrupted.
+
+        Args:
+            outcomes: how each connection goes, one of "fail" (drops before opening),
+                "auth" (authenticates, then closes), "stop" (opens, then is interrupted)
+                or "sleep" (drops before opening, then is interrupted while waiting to reconnect)
+
+        Returns: the URLs connected to, the payloads sent and the delays slept between connections
+
+        Raises:
+            AssertionError: if the interrupt does not exit from the StocksStream constructor
+        """
+        urls: ListType[str] = []
+        sent: ListType[str] = []
+        delays: ListType[float] = []
+        remaining = iter(outcomes)
+
+        def sleep(delay: float) -> None:
+            if outcomes[len(delays)] == "sleep":
+                raise KeyboardInterrupt
+            delays.append(delay)
+
+        class FakeWebSocketApp:
+            def __init__(self, url: str, **callbacks: Any) -> None:
+                urls.append(url)
+                self.callbacks = callbacks
+
+            def send(self, data: str) -> None:
+                sent.append(data)
+
+            def run_forever(self, **kwargs: Any) -> None:
+                outcome = next(remaining)
+                if outcome in ("fail", "sleep"):
+                    return
+                self.callbacks["on_open"](self)
+                if outcome == "auth":
+                    self.callbacks["on_message"](self, '{"authState": true}')
+                else:
+                    self.callbacks["on_error"](self, KeyboardInterrupt())
+
+        with patch("sentipy.ws.WebSocketApp", FakeWebSocketApp), patch(
+            "sentipy.ws.time.sleep", sleep
+        ), self.assertRaises(SystemExit):
+            StocksStream("token", "key", lambda update: None, iter(["AAPL", "TSLA"]))
+        return urls, sent, delays
+
+    @beartype
+    def test_stream_auth(self) -> None:
+        """Tests that a StocksStream sends its credentials and symbols, then stops its dispatch thread."""
+        urls, sent, _ = self.run_stream(["stop"])
+        self.assertEqual(urls, [StocksStream.base_url + "stocks"])
+        self.assertEqual(
+            [json.loads(payload) for payload in sent],
+            [{"key": "key", "token": "token", "symbols": ["AAPL", "TSLA"]}],
+        )
+        for thread in threading.enumerate():
+            if thread.name == "sentipy-ws-dispatch":
+                thread.join(timeout=1)
+                self.assertFalse(thread.is_alive())
+
+    @beartype
+    def test_stream_interrupt(self) -> None:
+        """Tests that an interrupt exits from a StocksStream, whether it is connected or waiting to reconnect."""
+        urls, _, _ = self.run_stream(["stop"])
+        self.assertEqual(len(urls), 1)
+        urls, _, delays = self.run_stream(["fail", "sleep"])
+        self.assertEqual(len(urls), 2)
+        self.assertEqual(delays, [1.0])
+
+    @beartype
+    def test_stream_backoff(self) -> None:
+        """Tests that reconnections back off exponentially up to a limit, and start over after authenticating."""
+        with patch.object(StocksStream, "max_reconnect_delay", 3.0):
+            _, sent, delays = self.run_stream(["fail", "fail", "fail", "auth", "stop"])
+        # every connection that opens authenticates again
+        self.assertEqual(len(sent), 2)
+        self.assertEqual(delays, [1.0, 2.0, 3.0, 1.0])
+
+    @beartype
+    def test_check_metric(self) -> None:
+        """Tests that only metrics the API provides are accepted."""
+        _check_metric("AHI")
+        with self.assertRaises(ValueError):
+            _check_metric("not_a_metric")
+
+    @beartype
+    def test_bulk_chunks(self) -> None:
+        """Tests that `bulk` returns stocks in the requested order when the chunks finish out of order."""
+        symbols = [f"S{i}" for i in range(10)]
+
+        def bulk_chunk(chunk: ListType[str], enrich: bool) -> ListType[Any]:
+            # the earlier a chunk was requested, the later it completes
+            time.sleep(0.05 * (len(symbols) - symbols.index(chunk[0])) / len(symbols))
+            return [{"symbol": symbol, "AHI": 1.0} for symbol in chunk]
+
+        with patch.object(self.sentipy, "_bulk_chunk", bulk_chunk):
+            data = self.sentipy.bulk(symbols, chunk_size=3, max_workers=4)
+        self.assertEqual([stock.symbol for stock in data], symbols)  # type: ignore[attr-defined]
+
+    @beartype
+    def test_bulk_arguments(self) -> None:
+        """Tests that `bulk` rejects chunk sizes and worker counts below 1 before making any request."""
+        with patch.object(self.sentipy, "_bulk_chunk") as bulk_chunk:
+            for chunk_size, max_workers in [(0, 8), (-1, 8), (100, 0)]:
+                with self.assertRaises(ValueError):
+                    self.sentipy.bulk(
+                        ["AAPL"], chunk_size=chunk_size, max_workers=max_workers
+                    )
+        bulk_chunk.assert_not_called()
+
+    @beartype
+    def test_quote_many(self) -> None:
+        """Tests that `quote_many` maps each symbol to its quote."""
+        results = [{"symbol": "AAPL", "AHI": 1.0}, {"symbol": "TSLA", "AHI": 2.0}]
+        with patch.object(
+            self.sentipy, "_iter_base_request", return_value=iter(results)
+        ) as request:
+            data = self.sentipy.quote_many(["AAPL", "TSLA"])
+        request.assert_called_once_with(
+            "bulk", params={"symbols": "AAPL,TSLA", "enrich": False}
+        )
+        self.assertEqual(list(data), ["AAPL", "TSLA"])
+        self.assertEqual(data["TSLA"].AHI, 2.0)
+
+    @beartype
+    def test_cache_expiry(self) -> None:
+        """Tests that cached responses are only returned until they expire."""
+        cache = TTLCache()
+        cache.set(("parsed",), {"fresh": True}, 60)
+        cache.set(("raw",), {"fresh": False}, 0)
+        self.assertEqual(cache.get(("parsed",)), {"fresh": True})
+        self.assertIsNone(cache.get(("raw",)))
+        self.assertIsNone(cache.get(("quote",)))
+
+    @beartype
+    def test_cache_threads(self) -> None:
+        """Tests that a full cache can be used from several threads at once."""
+        cache = TTLCache(maxsize=16)
+        errors: ListType[BaseException] = []
+
+        def fill(worker: int) -> None:
+            try:
+                for i in range(2000):
+                    cache.set(("parsed", worker, i), i, 60 if i % 2 else 0)
+                    cache.get(("parsed", worker, i - 1))
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=fill, args=(worker,)) for worker in range(8)]
+        # switch threads as often as possible, so that they interleave inside the cache
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache._entries), 16)
+
+    @beartype
+    def test_cache_credentials(self) -> None:
+        """Tests that cached responses are not shared between credentials."""
+        with patch.object(
+            self.sentipy, "_base_request", return_value={"success": True}
+        ) as request:
+            self.sentipy._cached_request("supported")
+            self.sentipy._cached_request("supported")
+            self.assertEqual(request.call_count, 1)
+            self.sentipy.token = "other token"
+            self.sentipy._cached_request("supported")
+            self.assertEqual(request.call_count, 2)
+
+    @beartype
+    def test_cache_disk(self) -> None:
+        """Tests that cached responses outlive the cache through its directory, and that clearing it keeps other files."""
+        with tempfile.TemporaryDirectory() as directory:
+            other = os.path.join(directory, "other.json")
+            with open(other, "w") as file:
+                file.write("{}")
+
+            cache = TTLCache(directory)
+            cache.set(("parsed", "AAPL"), {"symbol": "AAPL"}, 60)
+            cache.set(("parsed", "TSLA"), {"symbol": "TSLA"}, 0)
+
+            reloaded = TTLCache(directory)
+            self.assertEqual(reloaded.get(("parsed", "AAPL")), {"symbol": "AAPL"})
+            self.assertIsNone(reloaded.get(("parsed", "TSLA")))
+
+            cache.clear()
+            self.assertIsNone(TTLCache(directory).get(("parsed", "AAPL")))
+            self.assertTrue(os.path.exists(other))
+
+
+class AsyncSentipyTestCase(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asyncio client, run against stubbed connections."""
+
+    # beartype checks the coroutine object returned by an async function rather than its result,
+    # so the coroutine tests below are not decorated
+
+    @beartype
+    def setUp(self) -> None:
+        """Creates a client with dummy credentials, which never reaches the API."""
+        self.sentipy = AsyncSentipy(key="key", token="token")
+
+    async def asyncTearDown(self) -> None:
+        """Closes the client's session, if a test opened one."""
+        await self.sentipy.close()
+
+    @beartype
+    def respond(
+        self, status: int, body: object
+    ) -> TupleType[Any, ListType[TupleType[str, Any]]]:
+        """Stubs out aiohttp's GET requests with a fixed response.
+
+        Args:
+            status: the HTTP status code to respond with
+            body: the JSON response body
+
+        Returns: the patch to apply, and the list that each request's URL and query parameters are added to
+        """
+        requests: ListType[TupleType[str, Any]] = []
+        content = json.dumps(body).encode("utf-8")
+
+        class FakeResponse:
+            def __init__(self) -> None:
+                self.status = status
+
+            async def __aenter__(self) -> "FakeResponse":
+                return self
+
+            async def __aexit__(self, *args: object) -> None:
+                pass
+
+            async def read(self) -> bytes:
+                return content
+
+        def get(session: aiohttp.ClientSession, url: str, params: Any) -> FakeResponse:
+            requests.append((url, params))
+            return FakeResponse()
+
+        return patch.object(aiohttp.ClientSession, "get", get), requests
+
+    async def test_base_request(self) -> None:
+        """Tests that requests carry the credentials, with booleans passed as strings."""
+        stub, requests = self.respond(200, {"success": True})
+        with stub:
+            await self.sentipy._base_request(
+                "quote", {"symbol": "AAPL", "enrich": True}
+            )
+        self.assertEqual(
+            requests,
+            [
+                (
+                    AsyncSentipy.base_url + "quote",
+                    {
+                        "token": "token",
+                        "key": "key",
+                        "symbol": "AAPL",
+                        "enrich": "True",
+                    },
+                )
+            ],
+        )
+
+    async def test_quotes(self) -> None:
+        """Tests that `quote`, `bulk` and `quote_many` return quote records, keyed by symbol for `quote_many`."""
+        stub, _ = self.respond(
+            200, {"success": True, "symbol": "AAPL", "results": {"AHI": 1.5}}
+        )
+        with stub:
+            quote = await self.sentipy.quote("AAPL")
+        self.assertIsInstance(quote, _QuoteRecord)
+        self.assertEqual((quote.symbol, quote.AHI), ("AAPL", 1.5))  # type: ignore[attr-defined]
+
+        results = [{"symbol": "AAPL", "AHI": 1.0}, {"symbol": "TSLA", "AHI": 2.0}]
+        stub, requests = self.respond(200, {"success": True, "results": results})
+        with stub:
+            bulk = await self.sentipy.bulk(["AAPL", "TSLA"])
+            quotes = await self.sentipy.quote_many(iter(["AAPL", "TSLA"]))
+        self.assertEqual(
+            [params["symbols"] for _, params in requests], ["AAPL,TSLA"] * 2
+        )
+        self.assertTrue(all(isinstance(stock, _QuoteRecord) for stock in bulk))
+        self.assertEqual([stock.symbol for stock in bulk], ["AAPL", "TSLA"])
+        self.assertEqual(list(quotes), ["AAPL", "TSLA"])
+        self.assertIsInstance(quotes["TSLA"], _QuoteRecord)
+        self.assertEqual(quotes["TSLA"].AHI, 2.0)
+
+    async def test_unknown_metric(self) -> None:
+        """Tests that `sort` and `historical` reject unknown metrics without making a request."""
+        stub, requests = self.respond(200, {"success": True, "results": []})
+        with stub:
+            with self.assertRaises(ValueError):
+                await self.sentipy.sort("not_a_metric", 10)
+            with self.assertRaises(ValueError):
+                await self.sentipy.historical("AAPL", "not_a_metric", 0, 1)
+        self.assertEqual(requests, [])
+
+    async def test_errors(self) -> None:
+        """Tests that error responses raise the same exceptions as the synchronous client."""
+        stub, _ = self.respond(400, {"success": False, "message": "Unknown symbol"})
+        with stub, self.assertRaisesRegex(Exception, "^Unknown symbol$"):
+            await self.sentipy.quote("NOPE")
+
+        stub, _ = self.respond(401, {"success": False, "message": "Unauthorized"})
+        with stub, self.assertRaisesRegex(ValueError, "Incorrect key or token"):
+            await self.sentipy.quote("AAPL")
+
+    async def test_close(self) -> None:
+        """Tests that closing the client, directly or by leaving its context, discards its session."""
+        session = self.sentipy._get_session()
+        await self.sentipy.close()
+        self.assertIsNone(self.sentipy._session)
+        self.assertTrue(session.closed)
+
+        async with self.sentipy as sentipy:
+            session = sentipy._get_session()
+        self.assertIsNone(sentipy._session)
+        self.assertTrue(session.closed)
+
+    async def test_stream(self) -> None:
+        """Tests that `stream` skips non-text frames, backs off between connections and fails on rejected credentials."""
+        text, binary = aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY
+        connections: ListType[Any] = [
+            aiohttp.ClientConnectionError("refused"),
+            asyncio.TimeoutError(),
+            # closes straight away
+            [],
+            [
+                aiohttp.WSMessage(binary, b"\x00", None),
+                aiohttp.WSMessage(text, '{"authState": true}', None),
+                aiohttp.WSMessage(text, '{"symbol": "AAPL", "AHI": 1.5}', None),
+            ],
+            [aiohttp.WSMessage(text, '{"authState": false}', None)],
+        ]
+        remaining = iter(connections)
+        urls: ListType[str] = []
+        sent: ListType[str] = []
+
+        class FakeWebSocket:
+            def __init__(self, url: str, heartbeat: float) -> None:
+                urls.append(url)
+
+            async def __aenter__(self) -> "FakeWebSocket":
+                outcome = next(remaining)
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                self.messages = outcome
+                return self
+
+            async def __aexit__(self, *args: object) -> None:
+                pass
+
+            async def send_str(self, data: str) -> None:
+                sent.append(data)
+
+            async def __aiter__(self) -> Any:
+                for message in self.messages:
+                    yield message
+
+        session = self.sentipy._get_session()
+        updates: ListType[str] = []
+        with patch.object(session, "ws_connect", FakeWebSocket), patch(
+            "asyncio.sleep", new_callable=AsyncMock
+        ) as sleep, patch.object(_Stream, "max_reconnect_delay", 3.0):
+            with self.assertRaises(ValueError):
+                async for update in self.sentipy.stream(["AAPL"]):
+                    updates.append(update.symbol)
+
+        self.assertEqual(updates, ["AAPL"])
+        self.assertEqual(urls, [_Stream.base_url + "stocks"] * len(connections))
+        # every connection that opens authenticates first
+        self.assertEqual(
+            [json.loads(payload) for payload in sent],
+            [{"key": "key", "token": "token", "symbols": ["AAPL"]}] * 3,
+        )
+        # doubling up to the limit, and starting over after authenticating
+        self.assertEqual(
+            [call.args[0] for call in sleep.await_args_list], [1.0, 2.0, 3.0, 1.0]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()